@@ -16,11 +16,12 @@ class AliasParser:
                 for line in f:
                     line = line.strip()
                     if line and not line.startswith("#") and "=" in line:
-                        folder_name, alias = line.split("=", 1)
+                        folder_name, _, alias = line.partition("=")
                         self.aliases[folder_name.strip()] = alias.strip()
 
     def get_display_name(self, folder_name: str, use_real_name: bool = False) -> str:
         """Get display name for folder (alias or real name)"""
-        if use_real_name or folder_name not in self.aliases:
+        if use_real_name:
             return folder_name
-        return self.aliases[folder_name]
+        # Single dict lookup instead of a membership test plus a lookup
+        return self.aliases.get(folder_name, folder_name)
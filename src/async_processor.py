@@ -0,0 +1,206 @@
+import asyncio
+import time
+from typing import Optional, Dict, Any, List, Callable
+
+from git_utils import _json_loads, parse_status_v2
+from parallel_processor import RepoResult
+
+
+class AsyncRepoProcessor:
+    """Event-loop variant of ParallelRepoProcessor.
+
+    Each concurrent git/gh invocation costs a pipe pair instead of an OS
+    thread, so large repo counts scale past the point where thread
+    scheduling and GIL handoff start to dominate. Subprocesses run via
+    asyncio.create_subprocess_exec with per-tool semaphores bounding
+    concurrency.
+    """
+
+    def __init__(self, repos: List[Any], max_workers: int = 8) -> None:
+        self.repos = repos
+        self.max_workers = max_workers
+        self.results: Dict[str, RepoResult] = {}
+        self.completed_count = 0
+        self.total_count = len(repos)
+        self._last_render = 0.0
+
+    def _maybe_render(
+        self,
+        display_callback: Optional[Callable[[Dict[str, RepoResult], str], None]],
+    ) -> None:
+        """Invoke the callback at most every 100 ms"""
+        if display_callback is None:
+            return
+        now = time.monotonic()
+        if now - self._last_render >= 0.1:
+            self._last_render = now
+            display_callback(self.results, "progress")
+
+    def process_all(
+        self,
+        display_callback: Optional[Callable[[Dict[str, RepoResult], str], None]] = None,
+    ) -> Dict[str, RepoResult]:
+        """Process all repositories on a fresh event loop"""
+        return asyncio.run(self._run(display_callback))
+
+    async def _run(
+        self,
+        display_callback: Optional[Callable[[Dict[str, RepoResult], str], None]],
+    ) -> Dict[str, RepoResult]:
+        # Local git is cheap but disk-bound; gh calls pay network latency,
+        # so they get a tighter bound like the old slow-phase pool did
+        self._git_sem = asyncio.Semaphore(max(self.max_workers, 16))
+        self._gh_sem = asyncio.Semaphore(min(4, self.max_workers))
+
+        for repo in self.repos:
+            self.results[repo.real_name] = RepoResult(
+                repo.real_name, repo.display_name
+            )
+
+        await asyncio.gather(
+            *[self._process_repo(repo, display_callback) for repo in self.repos]
+        )
+
+        # Debouncing may have dropped the last few updates; render the
+        # completed state once
+        if display_callback:
+            display_callback(self.results, "final")
+        return self.results
+
+    async def _run_cmd(
+        self, repo: Any, argv: List[str], sem: "asyncio.Semaphore"
+    ) -> Optional[bytes]:
+        """Run a command in the repo directory, returning stdout or None"""
+        async with sem:
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *argv,
+                    cwd=str(repo.path),
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+            except OSError:
+                return None
+            stdout, _ = await proc.communicate()
+            if proc.returncode != 0:
+                return None
+            return stdout
+
+    async def _process_repo(
+        self,
+        repo: Any,
+        display_callback: Optional[Callable[[Dict[str, RepoResult], str], None]],
+    ) -> None:
+        """Fast local reads first (the slow ops reuse the branch), then the
+        network-bound ops concurrently"""
+        result = self.results[repo.real_name]
+
+        branch = await self._fast(repo, result)
+        self._maybe_render(display_callback)
+
+        await asyncio.gather(
+            self._check_pr(repo, result, branch),
+            self._sync_status(repo, result, branch),
+            self._repo_url(repo, result),
+        )
+
+        self.completed_count += 1
+        self._maybe_render(display_callback)
+
+    async def _fast(self, repo: Any, result: RepoResult) -> str:
+        output = await self._run_cmd(
+            repo, ["git", "status", "--porcelain=v2", "--branch"], self._git_sem
+        )
+        if output is None:
+            if result.errors is not None:
+                result.errors["unstaged"] = "git status failed"
+                result.errors["branch"] = "git status failed"
+            return "detached"
+
+        branch, unstaged = parse_status_v2(output)
+        result.current_branch = branch
+        result.unstaged_changes = unstaged
+        repo._cached_data["current_branch"] = branch
+        repo._cached_data["unstaged_changes"] = unstaged
+        return branch
+
+    async def _check_pr(self, repo: Any, result: RepoResult, branch: str) -> None:
+        output = await self._run_cmd(
+            repo,
+            ["gh", "pr", "list", "--head", branch, "--json", "number,url"],
+            self._gh_sem,
+        )
+        pr_info: Dict[str, Any] = {"exists": False, "number": None, "url": None}
+        if output:
+            try:
+                prs = _json_loads(output)
+                if len(prs) > 0:
+                    pr = prs[0]
+                    pr_info = {
+                        "exists": True,
+                        "number": pr.get("number"),
+                        "url": pr.get("url"),
+                    }
+            except ValueError:
+                pass
+        result.pr_info = pr_info
+        repo._cached_data["pr_info"] = pr_info
+
+    async def _sync_status(self, repo: Any, result: RepoResult, branch: str) -> None:
+        await self._run_cmd(repo, ["git", "fetch"], self._gh_sem)
+
+        counts = await self._run_cmd(
+            repo,
+            [
+                "git",
+                "rev-list",
+                "--left-right",
+                "--count",
+                f"{branch}...origin/{branch}",
+            ],
+            self._git_sem,
+        )
+
+        if counts is None:
+            local = await self._run_cmd(
+                repo, ["git", "rev-parse", branch], self._git_sem
+            )
+            if not local:
+                sync_status: Dict[str, Any] = {
+                    "status": "unknown",
+                    "ahead": 0,
+                    "behind": 0,
+                }
+            else:
+                sync_status = {"status": "ahead", "ahead": 1, "behind": 0}
+        else:
+            parts = counts.decode("ascii", "replace").split()
+            if len(parts) != 2 or not parts[0].isdigit() or not parts[1].isdigit():
+                sync_status = {"status": "unknown", "ahead": 0, "behind": 0}
+            else:
+                sync_status = repo._sync_status_from_counts(
+                    int(parts[0]), int(parts[1])
+                )
+
+        result.sync_status = sync_status
+        result.is_remote_updated = str(sync_status.get("status", "")) == "synced"
+        repo._cached_data["sync_status"] = sync_status
+        repo._cached_data["is_remote_updated"] = result.is_remote_updated
+
+    def close(self) -> None:
+        """No pooled resources to release; present for interface parity"""
+
+    async def _repo_url(self, repo: Any, result: RepoResult) -> None:
+        output = await self._run_cmd(
+            repo, ["gh", "repo", "view", "--json", "url"], self._gh_sem
+        )
+        url: Optional[str] = None
+        if output:
+            try:
+                repo_data = _json_loads(output)
+                value = repo_data.get("url")
+                url = value if isinstance(value, str) else None
+            except ValueError:
+                pass
+        result.repo_url = url
+        repo._cached_data["repo_url"] = url
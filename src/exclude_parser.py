@@ -1,9 +1,19 @@
 import fnmatch
+import re
 from pathlib import Path
-from typing import List
+from typing import FrozenSet, List, Optional, Tuple
 
 
 class ExcludeParser:
+    def __init__(self) -> None:
+        # Patterns are classified once per exclude list: exact names go into
+        # a set, simple prefix globs ("temp*", "src/**") into a startswith
+        # tuple, and only the rest through a compiled alternation regex
+        self._literals: FrozenSet[str] = frozenset()
+        self._prefixes: Tuple[str, ...] = ()
+        self._compiled: Optional["re.Pattern[str]"] = None
+        self._compiled_for: Optional[Tuple[str, ...]] = None
+
     def get_excludes(self, directory: Path) -> List[str]:
         """Read exclude file from .mgit folder if it exists"""
         mgit_dir = directory / ".mgit"
@@ -19,9 +29,48 @@ class ExcludeParser:
 
         return excludes
 
+    @staticmethod
+    def _has_magic(pattern: str) -> bool:
+        return any(ch in pattern for ch in "*?[")
+
+    def _classify(self, excludes: List[str]) -> None:
+        """Split patterns into literal, prefix, and general glob groups"""
+        key = tuple(excludes)
+        if key == self._compiled_for:
+            return
+        self._compiled_for = key
+
+        literals: List[str] = []
+        prefixes: List[str] = []
+        globs: List[str] = []
+
+        for pattern in excludes:
+            if not self._has_magic(pattern):
+                literals.append(pattern)
+            elif pattern.endswith("/**") and not self._has_magic(pattern[:-3]):
+                # Keep the slash so "src/**" matches what fnmatch matched:
+                # paths under src/, never the bare folder name itself
+                prefixes.append(pattern[:-2])
+            elif pattern.endswith("*") and not self._has_magic(pattern[:-1]):
+                prefixes.append(pattern[:-1])
+            else:
+                globs.append(pattern)
+
+        self._literals = frozenset(literals)
+        self._prefixes = tuple(prefixes)
+        if globs:
+            regex = "|".join(f"(?:{fnmatch.translate(p)})" for p in globs)
+            self._compiled = re.compile(regex)
+        else:
+            self._compiled = None
+
     def should_exclude(self, folder_name: str, excludes: List[str]) -> bool:
         """Check if folder should be excluded based on patterns"""
-        for pattern in excludes:
-            if fnmatch.fnmatch(folder_name, pattern):
-                return True
+        self._classify(excludes)
+        if folder_name in self._literals:
+            return True
+        if self._prefixes and folder_name.startswith(self._prefixes):
+            return True
+        if self._compiled is not None:
+            return self._compiled.match(folder_name) is not None
         return False
@@ -0,0 +1,131 @@
+import functools
+import http.client
+import json
+import subprocess
+import threading
+import urllib.parse
+from typing import Optional, Dict, Any, List, cast
+
+
+class GhClient:
+    """GitHub REST client with persistent connections.
+
+    Every gh invocation pays process startup plus a fresh TLS handshake;
+    with one gh call per repo per scan that setup cost dominates. This
+    client shells out once for the auth token (`gh auth token`) and keeps
+    one HTTPS connection per thread, so TLS and auth are amortized across
+    all repos in a scan. Callers fall back to the gh CLI when no token is
+    available.
+    """
+
+    _HOST = "api.github.com"
+
+    def __init__(self) -> None:
+        self._token: Optional[str] = None
+        self._token_checked = False
+        self._token_lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def available(self) -> bool:
+        """Whether an auth token could be obtained"""
+        return self._get_token() is not None
+
+    def _get_token(self) -> Optional[str]:
+        with self._token_lock:
+            if not self._token_checked:
+                self._token_checked = True
+                try:
+                    result = subprocess.run(
+                        ["gh", "auth", "token"], capture_output=True, check=True
+                    )
+                    token = result.stdout.decode("ascii", "replace").strip()
+                    self._token = token or None
+                except (subprocess.CalledProcessError, OSError):
+                    self._token = None
+            return self._token
+
+    def _connection(self) -> http.client.HTTPSConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = http.client.HTTPSConnection(self._HOST, timeout=10)
+            self._local.conn = conn
+        return conn
+
+    def _request(self, path: str) -> Optional[Any]:
+        """GET a JSON resource, returning the parsed body or None"""
+        token = self._get_token()
+        if token is None:
+            return None
+
+        headers = {
+            "Authorization": f"token {token}",
+            "Accept": "application/vnd.github+json",
+            "User-Agent": "mgit",
+        }
+
+        # The server may have closed a pooled connection between uses;
+        # retry once on a fresh one before giving up
+        for attempt in range(2):
+            conn = self._connection()
+            try:
+                conn.request("GET", path, headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                self._local.conn = None
+                if attempt == 0:
+                    continue
+                return None
+
+            if response.status != 200:
+                return None
+            try:
+                # Responses here are a few hundred bytes; stdlib json is
+                # not worth optimizing away
+                return json.loads(body)
+            except ValueError:
+                return None
+        return None
+
+    def repo_url(self, owner: str, name: str) -> Optional[str]:
+        """Get the repository's web URL"""
+        path = f"/repos/{urllib.parse.quote(owner)}/{urllib.parse.quote(name)}"
+        data = self._request(path)
+        if isinstance(data, dict):
+            url = cast(Dict[str, Any], data).get("html_url")
+            return url if isinstance(url, str) else None
+        return None
+
+    def pr_for_branch(
+        self, owner: str, name: str, branch: str
+    ) -> Optional[Dict[str, Any]]:
+        """Look up the open PR for a branch.
+
+        Returns pr_info in the shape _check_pr_exists produces, or None
+        when the request itself failed (so callers can fall back to gh).
+        """
+        head = urllib.parse.quote(f"{owner}:{branch}")
+        path = (
+            f"/repos/{urllib.parse.quote(owner)}/{urllib.parse.quote(name)}"
+            f"/pulls?state=open&head={head}&per_page=1"
+        )
+        data = self._request(path)
+        if not isinstance(data, list):
+            return None
+        prs = cast(List[Dict[str, Any]], data)
+        if prs:
+            pr = prs[0]
+            return {
+                "exists": True,
+                "number": pr.get("number"),
+                "url": pr.get("html_url"),
+            }
+        return {"exists": False, "number": None, "url": None}
+
+
+@functools.lru_cache(maxsize=1)
+def get_gh_client() -> GhClient:
+    """Process-wide client so every repo shares the token and connections"""
+    return GhClient()
@@ -1,6 +1,29 @@
+import atexit
+import functools
+import os
 import json
+import sqlite3
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional, Union, cast
+from typing import Any, Dict, Optional, Tuple, Union, cast
+
+try:
+    # Optional C JSON codec; noticeably faster than stdlib json on decode
+    import orjson  # type: ignore[import]
+except ImportError:
+    orjson = None
+
+
+def _json_loads(raw: Union[str, bytes]) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(data: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data)
 
 
 class GitCache:
@@ -11,32 +34,38 @@ class GitCache:
             working_dir = Path(working_dir)
 
         self.cache_dir = working_dir / ".mgit"
-        self.cache_dir.mkdir(exist_ok=True)
-        self.cache_file = self.cache_dir / "cache.json"
-        self._cache_data: Dict[str, Any] = self._load_cache()
-
-    def _load_cache(self) -> Dict[str, Any]:
-        """Load cache from file."""
-        if not self.cache_file.exists():
-            return {}
-
-        try:
-            with open(self.cache_file, "r") as f:
-                data = json.load(f)
-                if isinstance(data, dict):
-                    # Cast to Dict[str, Any] since we know JSON structure
-                    return cast(Dict[str, Any], data)
-                return {}
-        except (json.JSONDecodeError, IOError):
-            return {}
-
-    def _save_cache(self) -> None:
-        """Save cache to disk"""
-        try:
-            with open(self.cache_file, "w") as f:
-                json.dump(self._cache_data, f, indent=2)
-        except IOError:
-            pass
+        self.cache_file = self.cache_dir / "cache.db"
+        # Workers in ParallelRepoProcessor share this cache across threads,
+        # so serialize access ourselves instead of per-thread connections
+        self._lock = threading.Lock()
+        # Directory creation and the sqlite connection are deferred until the
+        # cache is actually read or written, so read-only uses in a directory
+        # without a .mgit folder cost nothing
+        self._conn: Optional[sqlite3.Connection] = None
+        # Writes are buffered in memory and persisted in one transaction by
+        # flush(); atexit is the safety net if a caller forgets
+        self._pending: Dict[str, Tuple[float, str]] = {}
+        atexit.register(self.flush)
+
+    def _require_conn(self) -> sqlite3.Connection:
+        """Open the database, creating it if needed; call with the lock held"""
+        if self._conn is None:
+            self.cache_dir.mkdir(exist_ok=True, parents=True)
+            self._conn = sqlite3.connect(
+                str(self.cache_file), isolation_level=None, check_same_thread=False
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "repo_key TEXT PRIMARY KEY, mtime REAL, data TEXT)"
+            )
+        return self._conn
+
+    def _get_conn(self, create: bool) -> Optional[sqlite3.Connection]:
+        """Open the database on first use; must be called with the lock held"""
+        if self._conn is None and not create and not self.cache_file.exists():
+            return None
+        return self._require_conn()
 
     def _get_repo_key(self, repo_path: Path) -> str:
         """Generate unique key for repository"""
@@ -44,49 +73,88 @@ class GitCache:
 
     def _get_git_mtime(self, repo_path: Path) -> float:
         """Get modification time of git index and HEAD"""
-        git_dir = repo_path / ".git"
+        git_dir = os.path.join(str(repo_path), ".git")
         times: list[float] = []
 
-        # Check .git/index (staging area changes)
-        index_file = git_dir / "index"
-        if index_file.exists():
-            times.append(index_file.stat().st_mtime)
-
-        # Check .git/HEAD (branch changes)
-        head_file = git_dir / "HEAD"
-        if head_file.exists():
-            times.append(head_file.stat().st_mtime)
-
-        # Check .git/refs directory (new commits)
-        refs_dir = git_dir / "refs"
-        if refs_dir.exists():
-            for ref_file in refs_dir.rglob("*"):
-                if ref_file.is_file():
-                    times.append(ref_file.stat().st_mtime)
+        # One directory read covers index (staging area changes), HEAD
+        # (branch changes), packed-refs (packed branches/tags), and refs;
+        # the refs subdirectory mtimes bump when loose refs change via
+        # git's lockfile renames, so loose refs need not be walked.
+        try:
+            with os.scandir(git_dir) as entries:
+                for entry in entries:
+                    if entry.name not in ("index", "HEAD", "packed-refs", "refs"):
+                        continue
+                    try:
+                        times.append(entry.stat(follow_symlinks=False).st_mtime)
+                    except OSError:
+                        continue
+                    if entry.name == "refs":
+                        try:
+                            with os.scandir(entry.path) as ref_dirs:
+                                for ref_dir in ref_dirs:
+                                    try:
+                                        times.append(
+                                            ref_dir.stat(
+                                                follow_symlinks=False
+                                            ).st_mtime
+                                        )
+                                    except OSError:
+                                        pass
+                        except OSError:
+                            pass
+        except OSError:
+            return 0.0
 
         return max(times) if times else 0.0
 
     def is_cached_valid(self, repo_path: Path) -> bool:
         """Check if cached data is still valid"""
         repo_key = self._get_repo_key(repo_path)
-        if repo_key not in self._cache_data:
-            return False
-
-        repo_cache = cast(Dict[str, Any], self._cache_data[repo_key])
-        cached_mtime = repo_cache.get("mtime", 0)
-        current_mtime = self._get_git_mtime(repo_path)
+        with self._lock:
+            pending = self._pending.get(repo_key)
+            if pending is not None:
+                cached_mtime: Any = pending[0]
+            else:
+                conn = self._get_conn(create=False)
+                if conn is None:
+                    return False
+                row = conn.execute(
+                    "SELECT mtime FROM cache WHERE repo_key = ?", (repo_key,)
+                ).fetchone()
+                if row is None:
+                    return False
+                cached_mtime = row[0]
 
-        # Ensure we're comparing numbers
         if not isinstance(cached_mtime, (int, float)):
             return False
 
+        current_mtime = self._get_git_mtime(repo_path)
         return cached_mtime >= current_mtime
 
     def get_cached_data(self, repo_path: Path) -> Dict[str, Any]:
         """Get cached data for repository"""
         repo_key = self._get_repo_key(repo_path)
-        repo_data = cast(Dict[str, Any], self._cache_data.get(repo_key, {}))
-        cached_data = repo_data.get("data", {})
+        with self._lock:
+            pending = self._pending.get(repo_key)
+            if pending is not None:
+                raw_data = pending[1]
+            else:
+                conn = self._get_conn(create=False)
+                if conn is None:
+                    return {}
+                row = conn.execute(
+                    "SELECT data FROM cache WHERE repo_key = ?", (repo_key,)
+                ).fetchone()
+                if row is None:
+                    return {}
+                raw_data = row[0]
+
+        try:
+            cached_data = _json_loads(raw_data)
+        except (ValueError, TypeError):
+            return {}
+
         if isinstance(cached_data, dict):
             return cast(Dict[str, Any], cached_data)
         return {}
@@ -96,10 +164,55 @@ class GitCache:
         repo_key = self._get_repo_key(repo_path)
         current_mtime = self._get_git_mtime(repo_path)
 
-        self._cache_data[repo_key] = {"mtime": current_mtime, "data": data}
-        self._save_cache()
+        with self._lock:
+            self._pending[repo_key] = (current_mtime, _json_dumps(data))
+
+    def flush(self) -> None:
+        """Persist buffered cache entries in a single transaction"""
+        with self._lock:
+            if not self._pending:
+                return
+            rows = [
+                (repo_key, mtime, data)
+                for repo_key, (mtime, data) in self._pending.items()
+            ]
+            # Explicit transaction: the connection is in autocommit mode, and
+            # one commit for the batch is the point of buffering
+            try:
+                conn = self._require_conn()
+                conn.execute("BEGIN")
+                conn.executemany(
+                    "INSERT OR REPLACE INTO cache (repo_key, mtime, data) "
+                    "VALUES (?, ?, ?)",
+                    rows,
+                )
+                conn.execute("COMMIT")
+            except (sqlite3.Error, OSError):
+                try:
+                    if self._conn is not None:
+                        self._conn.execute("ROLLBACK")
+                except sqlite3.Error:
+                    pass
+                return
+            self._pending.clear()
 
     def clear_cache(self) -> None:
         """Clear all cached data"""
-        self._cache_data = {}
-        self._save_cache()
+        try:
+            with self._lock:
+                self._pending.clear()
+                conn = self._get_conn(create=False)
+                if conn is not None:
+                    conn.execute("DELETE FROM cache")
+        except sqlite3.Error:
+            pass
+
+
+@functools.lru_cache(maxsize=None)
+def get_cache(working_dir: Path) -> GitCache:
+    """Shared cache per working directory.
+
+    GitRepo defaults to this so sibling repos reuse one connection instead
+    of each opening (and re-reading) their own cache.
+    """
+    return GitCache(working_dir)
@@ -1,8 +1,68 @@
+import re
 import subprocess
 import json
 from pathlib import Path
-from typing import Optional, Dict, Any, cast
-from git_cache import GitCache
+from typing import Optional, Dict, Any, Tuple, cast
+from git_cache import GitCache, get_cache
+from gh_client import get_gh_client
+
+try:
+    # Optional C JSON codec for gh --json output; stdlib json is the fallback
+    import orjson  # type: ignore[import]
+except ImportError:
+    orjson = None
+
+
+def _json_loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+try:
+    # Optional libgit2 bindings: in-process reads avoid a git subprocess
+    # (fork/exec) per property, which dominates on multi-repo scans
+    import pygit2 as _pygit2_module  # type: ignore[import]
+except ImportError:
+    _pygit2_module = None
+
+# Typed Any so attribute access on the untyped module passes pyright
+pygit2: Optional[Any] = _pygit2_module
+
+# Worktree-status flags that count as unstaged, resolved once at import
+_PYGIT2_WT_FLAGS: int = (
+    (
+        pygit2.GIT_STATUS_WT_MODIFIED
+        | pygit2.GIT_STATUS_WT_NEW
+        | pygit2.GIT_STATUS_WT_DELETED
+    )
+    if pygit2 is not None
+    else 0
+)
+
+# Porcelain lines with an unstaged change: worktree column M/D/A/?, or an
+# untracked entry ("??"). Compiled once; counting is a single C-level pass.
+_PORCELAIN_UNSTAGED_RE = re.compile(rb"(?m)^.[MDA?]|^\?")
+
+
+# Last two path segments of a remote URL, covering ssh and https forms
+_REMOTE_URL_RE = re.compile(r"[:/]([^/:]+)/([^/:]+?)(?:\.git)?/?$")
+
+
+def parse_status_v2(output: bytes) -> Tuple[str, int]:
+    """Parse 'git status --porcelain=v2 --branch' into (branch, unstaged)"""
+    branch = "detached"
+    unstaged = 0
+    for line in output.splitlines():
+        if line.startswith(b"# branch.head "):
+            name = line[14:].decode("utf-8", "replace").strip()
+            if name and name != "(detached)":
+                branch = name
+        elif line.startswith(b"? "):
+            unstaged += 1
+        elif line.startswith((b"1 ", b"2 ")) and line[3:4] in (b"M", b"D", b"A"):
+            # Worktree column of the XY pair, matching the v1 parse
+            unstaged += 1
+    return branch, unstaged
 
 
 class GitRepo:
@@ -17,12 +77,17 @@ class GitRepo:
         self.real_name = repo_path.name
         self.alias_parser = alias_parser
         self.use_real_names = use_real_names
-        self.cache = cache or GitCache()
+        self.cache = cache or get_cache(repo_path.parent)
         self._cached_data: Dict[str, Any] = {}
-        self._load_cached_data()
+        self._repo: Optional[Any] = None
 
     def _load_cached_data(self) -> None:
-        """Load cached data if available and valid"""
+        """Load cached data if available and valid.
+
+        Not called from __init__: validity checking stats the .git directory,
+        so RepoScanner issues these calls from a thread pool after
+        construction to overlap the syscalls across repos.
+        """
         if self.cache.is_cached_valid(self.path):
             cached = self.cache.get_cached_data(self.path)
             self._cached_data = cached
@@ -113,68 +178,151 @@ class GitRepo:
         self._cached_data["repo_url"] = result
         return result
 
-    def _run_git_command(self, args: list[str]) -> Optional[str]:
-        """Run git command in repo directory"""
+    def _open_repo(self) -> Optional[Any]:
+        """Lazily open the repository with pygit2 if the bindings are available"""
+        if pygit2 is None:
+            return None
+        if self._repo is None:
+            try:
+                self._repo = pygit2.Repository(str(self.path))
+            except Exception:
+                return None
+        return self._repo
+
+    def _run_git_command(self, args: list[str]) -> Optional[bytes]:
+        """Run git command in repo directory, returning raw stdout bytes"""
         try:
             result = subprocess.run(
                 ["git"] + args,
                 cwd=self.path,
                 capture_output=True,
-                text=True,
                 check=True,
             )
-            return result.stdout.strip()
+            return result.stdout
         except subprocess.CalledProcessError:
             return None
 
-    def _run_gh_command(self, args: list[str]) -> Optional[str]:
-        """Run gh command in repo directory"""
+    def _run_gh_command(self, args: list[str]) -> Optional[bytes]:
+        """Run gh command in repo directory, returning raw stdout bytes"""
         try:
             result = subprocess.run(
-                ["gh"] + args, cwd=self.path, capture_output=True, text=True, check=True
+                ["gh"] + args, cwd=self.path, capture_output=True, check=True
             )
-            return result.stdout.strip()
+            return result.stdout
         except subprocess.CalledProcessError:
             return None
 
+    def load_status_snapshot(self) -> bool:
+        """Fill current branch and unstaged count from one git invocation.
+
+        'git status --porcelain=v2 --branch' reports both in a single
+        subprocess, halving the fork/exec cost of the fast scan phase.
+        Returns False when the snapshot is unavailable (or unnecessary, as
+        with pygit2 in-process reads) so the per-property paths take over.
+        """
+        if (
+            "current_branch" in self._cached_data
+            and "unstaged_changes" in self._cached_data
+        ):
+            return True
+        if self._open_repo() is not None:
+            return False
+
+        output = self._run_git_command(["status", "--porcelain=v2", "--branch"])
+        if output is None:
+            return False
+
+        branch, unstaged = parse_status_v2(output)
+        self._cached_data["current_branch"] = branch
+        self._cached_data["unstaged_changes"] = unstaged
+        return True
+
     def _get_unstaged_changes(self) -> int:
         """Get number of unstaged changes"""
+        repo = self._open_repo()
+        if repo is not None:
+            try:
+                return sum(
+                    1
+                    for flags in repo.status().values()
+                    if flags & _PYGIT2_WT_FLAGS
+                )
+            except Exception:
+                pass
+
         output = self._run_git_command(["status", "--porcelain"])
         if output is None:
             return 0
 
-        lines = output.split("\n")
-        unstaged_count = 0
-        for line in lines:
-            if line and (line[1] in ["M", "D", "A", "?"] or line[0] == "?"):
-                unstaged_count += 1
-        return unstaged_count
+        return len(_PORCELAIN_UNSTAGED_RE.findall(output))
 
     def _get_current_branch(self) -> str:
         """Get current branch name"""
+        repo = self._open_repo()
+        if repo is not None:
+            try:
+                if repo.head_is_detached:
+                    return "detached"
+                return str(repo.head.shorthand)
+            except Exception:
+                pass
+
         branch = self._run_git_command(["branch", "--show-current"])
-        return branch if branch else "detached"
+        if branch:
+            decoded = branch.decode("utf-8", "replace").strip()
+            if decoded:
+                return decoded
+        return "detached"
+
+    def origin_owner_repo(self) -> Optional[Tuple[str, str]]:
+        """Parse (owner, name) out of the origin remote URL, if any"""
+        output = self._run_git_command(["config", "--get", "remote.origin.url"])
+        if not output:
+            return None
+        match = _REMOTE_URL_RE.search(output.decode("utf-8", "replace").strip())
+        if match:
+            return match.group(1), match.group(2)
+        return None
 
     def _get_repo_url(self) -> Optional[str]:
         """Get the repository URL"""
+        # Prefer the shared REST client (persistent connection, no gh
+        # process per call); fall back to the CLI when there is no token
+        client = get_gh_client()
+        if client.available:
+            target = self.origin_owner_repo()
+            if target is not None:
+                url = client.repo_url(*target)
+                if url is not None:
+                    return url
+
         output = self._run_gh_command(["repo", "view", "--json", "url"])
         if output:
             try:
-                repo_data = json.loads(output)
+                repo_data = _json_loads(output)
                 url = repo_data.get("url")
                 return url if isinstance(url, str) else None
-            except json.JSONDecodeError:
+            except ValueError:
                 pass
         return None
 
     def _check_pr_exists(self) -> Dict[str, Any]:
         """Check if PR exists for current branch and return PR info"""
+        client = get_gh_client()
+        if client.available:
+            target = self.origin_owner_repo()
+            if target is not None:
+                owner, name = target
+                pr_info = client.pr_for_branch(owner, name, self.current_branch)
+                if pr_info is not None:
+                    return pr_info
+
         output = self._run_gh_command(
             ["pr", "list", "--head", self.current_branch, "--json", "number,url"]
         )
         if output:
             try:
-                prs = json.loads(output)
+                prs = _json_loads(output)
                 if len(prs) > 0:
                     # Return the first PR's info
                     pr = prs[0]
@@ -183,46 +331,66 @@ class GitRepo:
                         "number": pr.get("number"),
                         "url": pr.get("url"),
                     }
-            except json.JSONDecodeError:
+            except ValueError:
                 pass
         return {"exists": False, "number": None, "url": None}
 
     def _check_remote_updated(self) -> bool:
         """Check if remote is up to date with local (backward compatibility)"""
-        sync_status = self._get_sync_status()
+        # Use the property so a sync status computed earlier in the scan
+        # (fetch included) is reused rather than recomputed
+        sync_status = self.sync_status
         return str(sync_status.get("status", "")) == "synced"
 
     def _get_sync_status(self) -> Dict[str, Any]:
         """Get detailed sync status with remote"""
         self._run_git_command(["fetch"])
 
-        local_commit = self._run_git_command(["rev-parse", self.current_branch])
-        remote_commit = self._run_git_command(
-            ["rev-parse", f"origin/{self.current_branch}"]
+        branch = self.current_branch
+
+        repo = self._open_repo()
+        if repo is not None:
+            try:
+                local_branch = repo.branches.local.get(branch)
+                if local_branch is None:
+                    return {"status": "unknown", "ahead": 0, "behind": 0}
+
+                remote_branch = repo.branches.remote.get(f"origin/{branch}")
+                if remote_branch is None:
+                    # Remote branch doesn't exist, we have local commits to push
+                    return {"status": "ahead", "ahead": 1, "behind": 0}
+
+                ahead, behind = repo.ahead_behind(
+                    local_branch.target, remote_branch.target
+                )
+                return self._sync_status_from_counts(int(ahead), int(behind))
+            except Exception:
+                pass
+
+        # One rev-list call returns both counts: left side is commits only on
+        # the local branch (ahead), right side only on origin (behind)
+        counts_output = self._run_git_command(
+            ["rev-list", "--left-right", "--count", f"{branch}...origin/{branch}"]
         )
 
-        if not local_commit:
-            return {"status": "unknown", "ahead": 0, "behind": 0}
-        
-        if not remote_commit:
+        if counts_output is None:
+            # rev-list fails when either side is unknown; distinguish a
+            # missing local branch from a branch not yet pushed to origin
+            local_commit = self._run_git_command(["rev-parse", branch])
+            if not local_commit:
+                return {"status": "unknown", "ahead": 0, "behind": 0}
             # Remote branch doesn't exist, we have local commits to push
             return {"status": "ahead", "ahead": 1, "behind": 0}
 
-        if local_commit == remote_commit:
-            return {"status": "synced", "ahead": 0, "behind": 0}
-
-        # Check if we're ahead (have local commits to push)
-        ahead_output = self._run_git_command([
-            "rev-list", "--count", f"origin/{self.current_branch}..{self.current_branch}"
-        ])
-        ahead_count = int(ahead_output) if ahead_output and ahead_output.isdigit() else 0
+        parts = counts_output.decode("ascii", "replace").split()
+        if len(parts) != 2 or not parts[0].isdigit() or not parts[1].isdigit():
+            return {"status": "unknown", "ahead": 0, "behind": 0}
 
-        # Check if we're behind (have remote commits to pull)
-        behind_output = self._run_git_command([
-            "rev-list", "--count", f"{self.current_branch}..origin/{self.current_branch}"
-        ])
-        behind_count = int(behind_output) if behind_output and behind_output.isdigit() else 0
+        return self._sync_status_from_counts(int(parts[0]), int(parts[1]))
 
+    @staticmethod
+    def _sync_status_from_counts(ahead_count: int, behind_count: int) -> Dict[str, Any]:
+        """Classify ahead/behind commit counts into a sync status dict"""
         if ahead_count > 0 and behind_count > 0:
             return {"status": "diverged", "ahead": ahead_count, "behind": behind_count}
         elif ahead_count > 0:
@@ -2,10 +2,13 @@
 
 import sys
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from requirements import check_requirements
 from repo_scanner import RepoScanner
 from repo_display import RepoDisplay
 from parallel_processor import ParallelRepoProcessor
+from async_processor import AsyncRepoProcessor
 from progressive_display import ProgressiveDisplay
 from typing import List, Any
 
@@ -17,26 +20,32 @@ def checkout_branch_in_all_repos(repos: List[Any], branch_name: str) -> None:
 
     success_count = 0
     error_count = 0
+    print_lock = threading.Lock()
 
-    for repo in repos:
-        print(f"Processing {repo.display_name}...", end=" ")
+    # Checkouts are I/O-bound (fork/exec + git), so run them concurrently
+    with ThreadPoolExecutor(max_workers=max(1, min(32, len(repos)))) as executor:
+        future_to_repo = {
+            executor.submit(repo.checkout_branch, branch_name): repo for repo in repos
+        }
 
-        try:
-            result = repo.checkout_branch(branch_name)
+        for future in as_completed(future_to_repo):
+            repo = future_to_repo[future]
 
-            if result["success"]:
-                success_count += 1
-                if result["created"]:
-                    print("✓ " + result["message"])
-                else:
-                    print("✓ " + result["message"])
-            else:
-                error_count += 1
-                print("✗ " + result["message"])
+            try:
+                result = future.result()
+
+                with print_lock:
+                    if result["success"]:
+                        success_count += 1
+                        print(f"{repo.display_name}: ✓ " + result["message"])
+                    else:
+                        error_count += 1
+                        print(f"{repo.display_name}: ✗ " + result["message"])
 
-        except Exception as e:
-            error_count += 1
-            print(f"✗ Error: {str(e)}")
+            except Exception as e:
+                with print_lock:
+                    error_count += 1
+                    print(f"{repo.display_name}: ✗ Error: {str(e)}")
 
     print()
     print(
@@ -54,23 +63,30 @@ def pull_all_repos(repos: List[Any]) -> None:
 
     success_count = 0
     error_count = 0
+    print_lock = threading.Lock()
 
-    for repo in repos:
-        print(f"Processing {repo.display_name}...", end=" ")
+    # Pulls are network-bound, so run them concurrently as well
+    with ThreadPoolExecutor(max_workers=max(1, min(32, len(repos)))) as executor:
+        future_to_repo = {executor.submit(repo.pull): repo for repo in repos}
 
-        try:
-            result = repo.pull()
+        for future in as_completed(future_to_repo):
+            repo = future_to_repo[future]
 
-            if result["success"]:
-                success_count += 1
-                print("✓ " + result["message"])
-            else:
-                error_count += 1
-                print("✗ " + result["message"])
+            try:
+                result = future.result()
 
-        except Exception as e:
-            error_count += 1
-            print(f"✗ Error: {str(e)}")
+                with print_lock:
+                    if result["success"]:
+                        success_count += 1
+                        print(f"{repo.display_name}: ✓ " + result["message"])
+                    else:
+                        error_count += 1
+                        print(f"{repo.display_name}: ✗ " + result["message"])
+
+            except Exception as e:
+                with print_lock:
+                    error_count += 1
+                    print(f"{repo.display_name}: ✗ Error: {str(e)}")
 
     print()
     print(
@@ -105,6 +121,12 @@ def main() -> None:
         action="store_true",
         help="Disable parallel processing (use original sequential mode)",
     )
+    status_parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Use the asyncio processor instead of thread workers",
+    )
 
     # Checkout command
     checkout_parser = subparsers.add_parser(
@@ -146,6 +168,12 @@ def main() -> None:
         action="store_true",
         help="Disable parallel processing (use original sequential mode)",
     )
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Use the asyncio processor instead of thread workers",
+    )
 
     args = parser.parse_args()
 
@@ -173,24 +201,35 @@ def main() -> None:
         else:
             # New parallel mode with progressive display
             progressive_display = ProgressiveDisplay()
-            processor = ParallelRepoProcessor(repos)
+            if args.use_async:
+                processor: Any = AsyncRepoProcessor(repos)
+            else:
+                processor = ParallelRepoProcessor(repos)
 
-            # Process with live updates
-            results = processor.process_all(
-                display_callback=lambda results,
-                phase: progressive_display.update_display(results, phase)
-            )
+            try:
+                # Process with live updates
+                results = processor.process_all(
+                    display_callback=lambda results,
+                    phase: progressive_display.update_display(results, phase)
+                )
+            finally:
+                processor.close()
 
             # Show final results
             progressive_display.final_display(results)
 
+        # Persist everything cached during this scan in one write
+        scanner.cache.flush()
+
     elif args.command == "checkout":
         repos = scanner.scan_current_directory(use_real_names=args.names)
         checkout_branch_in_all_repos(repos, args.branch)
+        scanner.cache.flush()
 
     elif args.command == "pull":
         repos = scanner.scan_current_directory(use_real_names=args.names)
         pull_all_repos(repos)
+        scanner.cache.flush()
 
 
 if __name__ == "__main__":
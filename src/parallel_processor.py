@@ -1,7 +1,56 @@
+import queue
+import subprocess
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import Optional, Dict, Any, List, Callable, Tuple
+from typing import Optional, Dict, Any, List, Callable, Tuple, cast
+
+from git_utils import _json_loads
+
+
+class _TTLCache:
+    """Result cache with expiry plus in-flight deduplication.
+
+    Completed values are served for ttl seconds; concurrent requests for a
+    key that is still being computed share the one in-flight call instead
+    of spawning their own.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: Dict[Any, Tuple[float, Any]] = {}
+        self._inflight: Dict[Any, "Future[Any]"] = {}
+
+    def get_or_compute(self, key: Any, compute: Callable[[], Any]) -> Any:
+        owner = False
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] < self.ttl:
+                return entry[1]
+            future: Optional["Future[Any]"] = self._inflight.get(key)
+            if future is None:
+                owner = True
+                future = Future()
+                self._inflight[key] = future
+
+        if not owner:
+            return future.result()
+
+        try:
+            value = compute()
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._inflight.pop(key, None)
+        future.set_result(value)
+        return value
 
 
 @dataclass
@@ -31,37 +80,153 @@ class ParallelRepoProcessor:
         self.completed_count = 0
         self.total_count = len(repos)
         self.display_lock = threading.Lock()
+        # Network results rarely change within a run; short TTL plus
+        # in-flight dedupe makes repeat calls for the same repo free
+        self._slow_cache = _TTLCache(ttl=30.0)
+        # Dirty marker for the renderer thread; maxsize=1 coalesces any
+        # burst of updates into a single pending render
+        self._render_q: "queue.Queue[Optional[int]]" = queue.Queue(maxsize=1)
+        # One pool for the processor's lifetime: spawning and joining
+        # max_workers threads per process_all call costs more than the
+        # work itself on short repo lists
+        self._pool = ThreadPoolExecutor(max_workers=max(self.max_workers, 16))
 
-    def process_repo_fast(self, repo: Any) -> RepoResult:
+    def process_repo_fast(self, repo: Any) -> Tuple[str, Dict[str, Any]]:
         """Process fast local git operations"""
-        result = RepoResult(repo.real_name, repo.display_name)
-        if result.errors is None:
-            result.errors = {}
+        updates: Dict[str, Any] = {}
+
+        # One batched subprocess fills branch and unstaged count together
+        # (no-op under pygit2, where reads are already in-process)
+        try:
+            repo.load_status_snapshot()
+        except Exception:
+            pass
 
+        # Go through the caching properties so the values land in the repo's
+        # _cached_data: the slow operations (_check_pr_exists,
+        # _get_sync_status) read current_branch again and must not respawn
+        # git for it
         try:
-            result.unstaged_changes = repo._get_unstaged_changes()
+            updates["unstaged_changes"] = repo.unstaged_changes
         except Exception as e:
-            result.errors["unstaged"] = str(e)
+            updates["unstaged_error"] = str(e)
 
         try:
-            result.current_branch = repo._get_current_branch()
+            updates["current_branch"] = repo.current_branch
         except Exception as e:
-            result.errors["branch"] = str(e)
+            updates["branch_error"] = str(e)
 
-        return result
+        return repo.real_name, updates
 
     def process_repo_slow(self, repo: Any) -> Tuple[str, Dict[str, Any]]:
-        """Process slow network operations"""
+        """Process slow network operations, deduped through the TTL cache"""
+        return self._slow_cache.get_or_compute(
+            repo.real_name, lambda: self._compute_repo_slow(repo)
+        )
+
+    def _bulk_pr_lookup(self) -> Dict[str, Dict[str, Any]]:
+        """Resolve PR info for every repo with one gh GraphQL call.
+
+        Returns a mapping of repo name to pr_info; repos missing from the
+        result (unparseable remote, gh failure) fall back to the per-repo
+        check. Runs once per scan via the TTL cache's in-flight dedupe.
+        """
+        aliases: Dict[str, str] = {}
+        query_parts: List[str] = []
+        for i, repo in enumerate(self.repos):
+            try:
+                target = repo.origin_owner_repo()
+                branch = repo.current_branch
+            except Exception:
+                continue
+            if target is None:
+                continue
+            owner, name = target
+            # Values are interpolated into the query; skip anything that
+            # would need escaping rather than building escape logic for it
+            if any('"' in s or "\\" in s for s in (owner, name, branch)):
+                continue
+            alias = f"r{i}"
+            aliases[alias] = repo.real_name
+            query_parts.append(
+                f'{alias}: repository(owner: "{owner}", name: "{name}") {{ '
+                f'pullRequests(states: OPEN, headRefName: "{branch}", '
+                "first: 1) { nodes { number url } } }"
+            )
+
+        if not query_parts:
+            return {}
+
+        query = "query { " + " ".join(query_parts) + " }"
+        try:
+            result = subprocess.run(
+                ["gh", "api", "graphql", "-f", f"query={query}"],
+                cwd=str(self.repos[0].path),
+                capture_output=True,
+                check=True,
+            )
+            payload = _json_loads(result.stdout)
+        except (subprocess.CalledProcessError, OSError, ValueError):
+            return {}
+
+        if not isinstance(payload, dict):
+            return {}
+        data = cast(Dict[str, Any], payload).get("data")
+        if not isinstance(data, dict):
+            return {}
+        data = cast(Dict[str, Any], data)
+
+        pr_infos: Dict[str, Dict[str, Any]] = {}
+        for alias, repo_name in aliases.items():
+            repo_data = data.get(alias)
+            if not isinstance(repo_data, dict):
+                continue
+            pulls: Dict[str, Any] = (
+                cast(Dict[str, Any], repo_data).get("pullRequests") or {}
+            )
+            nodes: List[Dict[str, Any]] = pulls.get("nodes") or []
+            if nodes:
+                pr = nodes[0]
+                pr_infos[repo_name] = {
+                    "exists": True,
+                    "number": pr.get("number"),
+                    "url": pr.get("url"),
+                }
+            else:
+                pr_infos[repo_name] = {"exists": False, "number": None, "url": None}
+        return pr_infos
+
+    def _compute_repo_slow(self, repo: Any) -> Tuple[str, Dict[str, Any]]:
+        """Run the slow network operations for one repo"""
         updates: Dict[str, Any] = {}
 
         try:
-            updates["pr_info"] = repo._check_pr_exists()
-        except Exception as e:
-            updates["pr_error"] = str(e)
+            bulk = self._slow_cache.get_or_compute(
+                "_bulk_pr_lookup", self._bulk_pr_lookup
+            )
+        except Exception:
+            bulk = {}
+        pr_info: Optional[Dict[str, Any]] = (
+            cast(Dict[str, Dict[str, Any]], bulk).get(repo.real_name)
+            if isinstance(bulk, dict)
+            else None
+        )
+
+        if pr_info is not None:
+            updates["pr_info"] = pr_info
+            repo._cached_data["pr_info"] = pr_info
+        else:
+            try:
+                updates["pr_info"] = repo._check_pr_exists()
+            except Exception as e:
+                updates["pr_error"] = str(e)
 
         try:
+            # _check_remote_updated computes and caches sync status via the
+            # property; read the property again rather than recomputing,
+            # which would repeat the fetch and rev-list
             updates["is_remote_updated"] = repo._check_remote_updated()
-            updates["sync_status"] = repo._get_sync_status()
+            updates["sync_status"] = repo.sync_status
         except Exception as e:
             updates["remote_error"] = str(e)
 
@@ -72,6 +237,57 @@ class ParallelRepoProcessor:
 
         return repo.real_name, updates
 
+    def _mark_dirty(self) -> None:
+        """Tell the renderer thread something changed; never blocks"""
+        try:
+            self._render_q.put_nowait(1)
+        except queue.Full:
+            pass
+
+    def _render_loop(
+        self,
+        display_callback: Callable[[Dict[str, RepoResult], str], None],
+    ) -> None:
+        """Consume dirty markers and render at the display's own pace.
+
+        Workers only drop a marker in the queue, so they never block on
+        terminal I/O or serialize behind a render in progress. The short
+        sleep after waking lets a burst of completions coalesce into one
+        redraw. A None marker ends the loop.
+        """
+        while True:
+            if self._render_q.get() is None:
+                return
+            time.sleep(0.05)
+            stop = False
+            while True:
+                try:
+                    if self._render_q.get_nowait() is None:
+                        stop = True
+                except queue.Empty:
+                    break
+            display_callback(self.results, "progress")
+            if stop:
+                return
+
+    def _process_repo_all(self, repo: Any) -> None:
+        """One worker pipeline per repo: fast local reads, then slow ops.
+
+        The fast ops are a few ms of fork/exec each; dispatching them as
+        separate pool tasks cost about as much scheduling as work. Running
+        them at the head of the slow worker keeps one submission per repo,
+        and the slow ops get the branch from _cached_data for free.
+        """
+        repo_name, updates = self.process_repo_fast(repo)
+        self.update_result(repo_name, updates)
+        with self.display_lock:
+            self.completed_count += 1
+        self._mark_dirty()
+
+        repo_name, updates = self.process_repo_slow(repo)
+        self.update_result(repo_name, updates)
+        self._mark_dirty()
+
     def update_result(self, repo_name: str, updates: Dict[str, Any]) -> None:
         """Thread-safe result update"""
         with self.display_lock:
@@ -90,43 +306,62 @@ class ParallelRepoProcessor:
         display_callback: Optional[Callable[[Dict[str, RepoResult], str], None]] = None,
     ) -> Dict[str, RepoResult]:
         """Process all repositories with parallel execution"""
-        # Phase 1: Fast local operations
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_repo = {
-                executor.submit(self.process_repo_fast, repo): repo
-                for repo in self.repos
-            }
+        # Pre-create every result so slow updates have somewhere to land
+        # regardless of completion order (and the display shows all repos
+        # immediately)
+        with self.display_lock:
+            for repo in self.repos:
+                self.results[repo.real_name] = RepoResult(
+                    repo.real_name, repo.display_name
+                )
 
-            for future in as_completed(future_to_repo):
-                result = future.result()
-                with self.display_lock:
-                    self.results[result.name] = result
-                    self.completed_count += 1
+        renderer: Optional[threading.Thread] = None
+        if display_callback:
+            renderer = threading.Thread(
+                target=self._render_loop, args=(display_callback,), daemon=True
+            )
+            renderer.start()
 
-                if display_callback:
-                    display_callback(self.results, "fast")
+        # One submission per repo: each worker runs the fast ops inline
+        # before the slow ones and drops a dirty marker for the renderer,
+        # so there is no second round of scheduling for the cheap local
+        # reads and no worker ever blocks on terminal I/O
+        futures = [
+            self._pool.submit(self._process_repo_all, repo)
+            for repo in self.repos
+        ]
+        for future in as_completed(futures):
+            future.result()
 
-        # Phase 2: Slow network operations
-        self._process_slow_operations(display_callback)
+        if renderer is not None:
+            # Never block on the sentinel: if the renderer died mid-render
+            # (e.g. BrokenPipeError from a closed stdout) with a marker
+            # still queued, a blocking put would hang the CLI. Drain, then
+            # best-effort put; the bounded join covers the rest
+            try:
+                self._render_q.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._render_q.put_nowait(None)
+            except queue.Full:
+                pass
+            renderer.join(timeout=2.0)
+
+        # Coalescing can swallow the last few updates, so always render
+        # the completed state once, synchronously, after the renderer is
+        # done
+        if display_callback:
+            display_callback(self.results, "final")
 
         return self.results
 
-    def _process_slow_operations(
-        self, display_callback: Optional[Callable[[Dict[str, RepoResult], str], None]]
-    ) -> None:
-        """Process slow network operations in separate executor"""
-        with ThreadPoolExecutor(max_workers=min(4, self.max_workers)) as executor:
-            # Submit all slow operations
-            futures = [
-                executor.submit(self.process_repo_slow, repo) for repo in self.repos
-            ]
-
-            # Process results as they complete
-            for future in as_completed(futures):
-                repo_name, updates = (
-                    future.result()
-                )  # We know this returns Tuple[str, Dict[str, Any]]
-                self.update_result(repo_name, updates)
-
-                if display_callback:
-                    display_callback(self.results, "slow")
+    def close(self) -> None:
+        """Shut down the worker pool once all processing is done"""
+        self._pool.shutdown(wait=True)
+
+    def __enter__(self) -> "ParallelRepoProcessor":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        self.close()
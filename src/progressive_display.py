@@ -1,15 +1,52 @@
+import bisect
+import os
 import sys
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Set, Tuple
 import re
 
+# OSC 8 hyperlink wrappers and SGR color codes; compiled once since the
+# display path strips ANSI for every cell on every refresh
+_ANSI_RE = re.compile(r"\033\]8;;[^\033]*\033\\|\033\]8;;\033\\|\033\[[0-9;]*m")
+
+# Raw stdout fd, resolved once: writing pre-encoded bytes through os.write
+# skips the TextIOWrapper lock and transcoding on every refresh. None when
+# stdout has no real fd (captured/redirected to an in-memory stream)
+try:
+    _STDOUT_FD: Optional[int] = sys.stdout.fileno()
+except (AttributeError, OSError, ValueError):
+    _STDOUT_FD = None
+
+# A rendered cell: its text plus the visible (ANSI-stripped) width
+Cell = Tuple[str, int]
+
 
 class ProgressiveDisplay:
+    # Sync status to colored indicator; looked up per row per refresh
+    _SYNC_ICONS = {
+        "synced": "\033[32m✓\033[0m",     # Green checkmark
+        "ahead": "\033[33m↑\033[0m",      # Yellow up arrow (local changes to push)
+        "behind": "\033[31m↓\033[0m",     # Red down arrow (remote changes to pull)
+        "diverged": "\033[31m↕\033[0m",   # Red up-down arrow (diverged)
+    }
+    _UNKNOWN = "\033[90m?\033[0m"         # Gray question mark
+
     def __init__(self) -> None:
         self.header_printed = False
         self.repo_lines: Dict[str, Any] = {}
         self.current_line = 0
         self.spinner_chars = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
         self.spinner_index = 0
+        # Diff-based refresh state: last rendered content per screen line,
+        # and grow-only column widths so settled rows are not re-rendered
+        # every time a callback fires
+        self._last_lines: Dict[int, str] = {}
+        self._widths: Optional[Tuple[int, int, int, int, int]] = None
+        self._last_rendered_line = 0
+        # Display order, maintained incrementally: results only ever gain
+        # entries during a scan, so insort on arrival beats re-sorting the
+        # whole dict every refresh
+        self._sorted_names: List[Tuple[str, str]] = []
+        self._known: Set[str] = set()
 
     def create_hyperlink(self, url: Optional[str], text: str) -> str:
         """Create OSC 8 hyperlink"""
@@ -20,37 +57,27 @@ class ProgressiveDisplay:
     def _get_sync_indicator(self, result: Any) -> str:
         """Get sync status indicator based on result sync status"""
         if result.sync_status is not None:
-            sync_status = result.sync_status
-            status = sync_status.get("status", "unknown")
-            
-            if status == "synced":
-                return "\033[32m✓\033[0m"      # Green checkmark
-            elif status == "ahead":
-                return "\033[33m↑\033[0m"      # Yellow up arrow (local changes to push)
-            elif status == "behind":
-                return "\033[31m↓\033[0m"      # Red down arrow (remote changes to pull)
-            elif status == "diverged":
-                return "\033[31m↕\033[0m"      # Red up-down arrow (diverged)
-            else:
-                return "\033[90m?\033[0m"      # Gray question mark (unknown)
+            status = result.sync_status.get("status", "unknown")
+            return self._SYNC_ICONS.get(status, self._UNKNOWN)
         elif result.is_remote_updated is not None:
             # Fallback to old behavior
             if result.is_remote_updated:
-                return "\033[32m✓\033[0m"      # Green checkmark
+                return self._SYNC_ICONS["synced"]
             else:
                 return "\033[31m✗\033[0m"      # Red X
         else:
-            return "\033[90m?\033[0m"          # Gray question mark for errors
+            return self._UNKNOWN
 
-    def pad_with_ansi(self, text: str, width: int, align: str = "left") -> str:
-        """Pad text that may contain ANSI sequences to specified display width"""
-        # Calculate visible character count (excluding ANSI sequences)
-        import re
+    def pad_with_ansi(
+        self, text: str, width: int, align: str = "left", vlen: Optional[int] = None
+    ) -> str:
+        """Pad text that may contain ANSI sequences to specified display width.
 
-        visible_text = re.sub(
-            r"\033\]8;;[^\033]*\033\\|\033\]8;;\033\\|\033\[[0-9;]*m", "", text
-        )
-        visible_len = len(visible_text)
+        Callers that already know the visible width (hyperlink and colored
+        cells are built from plain text of known length) pass it as vlen to
+        skip the ANSI strip."""
+        # Calculate visible character count (excluding ANSI sequences)
+        visible_len = len(_ANSI_RE.sub("", text)) if vlen is None else vlen
 
         if visible_len >= width:
             return text
@@ -65,23 +92,44 @@ class ProgressiveDisplay:
         else:  # right align
             return " " * padding + text
 
+    def _write(self, s: str) -> None:
+        """Write to the terminal, unbuffered.
+
+        Goes straight to the stdout fd with pre-encoded bytes when stdout
+        is the real terminal stream; falls back to the current sys.stdout
+        when it has been swapped out (captured or redirected in-process).
+        """
+        if _STDOUT_FD is not None and sys.stdout is sys.__stdout__:
+            os.write(_STDOUT_FD, s.encode("utf-8"))
+        else:
+            sys.stdout.write(s)
+            sys.stdout.flush()
+
     def clear_screen(self) -> None:
         """Clear screen and reset cursor"""
-        print("\033[2J\033[H", end="")
+        self._write("\033[2J\033[H")
 
     def move_to_line(self, line_num: int) -> None:
         """Move cursor to specific line"""
-        print(f"\033[{line_num};1H", end="")
+        self._write(f"\033[{line_num};1H")
 
     def clear_to_end_of_line(self) -> None:
         """Clear from cursor to end of line"""
-        print("\033[K", end="")
+        self._write("\033[K")
 
-    def print_header(self, repo_w: int, unstaged_w: int, branch_w: int, pr_w: int, sync_w: int) -> None:
-        """Print table header with given column widths"""
+    def print_header(
+        self,
+        buf: List[str],
+        repo_w: int,
+        unstaged_w: int,
+        branch_w: int,
+        pr_w: int,
+        sync_w: int,
+    ) -> None:
+        """Append screen-clear and table header to the output buffer"""
         # Only clear screen and print header once
         if not self.header_printed:
-            self.clear_screen()
+            buf.append("\033[2J\033[H")
             header = (
                 f"{('Repository'):<{repo_w}} "
                 f"{('Unstaged'):<{unstaged_w}} "
@@ -89,8 +137,8 @@ class ProgressiveDisplay:
                 f"{('PR'):<{pr_w}} "
                 f"{('Sync'):^{sync_w}}"
             )
-            print(header)
-            print("-" * len(header))
+            buf.append(header + "\n")
+            buf.append("-" * len(header) + "\n")
             self.header_printed = True
             self.current_line = 3
 
@@ -98,27 +146,36 @@ class ProgressiveDisplay:
 
     def update_display(self, results: Dict[str, Any], phase: str = "") -> None:
         """Update the display with current results"""
-        # Build rows first to compute dynamic widths (ANSI-aware)
-        sorted_results = sorted(results.values(), key=lambda r: r.display_name)
-        rows: List[Tuple[str, str, str, str, str]] = []
+        # Build rows first to compute dynamic widths. Each cell carries its
+        # visible length, known at construction time even for hyperlink and
+        # colored cells, so no ANSI stripping happens on the hot path
+        if len(self._known) != len(results):
+            for name, result in results.items():
+                if name not in self._known:
+                    self._known.add(name)
+                    bisect.insort(self._sorted_names, (result.display_name, name))
+        sorted_results = [results[name] for _, name in self._sorted_names]
+        rows: List[Tuple[Cell, Cell, Cell, Cell, Cell]] = []
         for result in sorted_results:
             spinner_char = self.spinner_chars[self.spinner_index % len(self.spinner_chars)]
 
             # unstaged
             if result.unstaged_changes is not None:
-                unstaged = str(result.unstaged_changes)
+                unstaged_text = str(result.unstaged_changes)
             elif result.errors and "unstaged" in result.errors:
-                unstaged = "Error"
+                unstaged_text = "Error"
             else:
-                unstaged = spinner_char
+                unstaged_text = spinner_char
+            unstaged = (unstaged_text, len(unstaged_text))
 
             # branch
             if result.current_branch is not None:
-                branch = result.current_branch
+                branch_text = result.current_branch
             elif result.errors and "branch" in result.errors:
-                branch = "Error"
+                branch_text = "Error"
             else:
-                branch = spinner_char
+                branch_text = spinner_char
+            branch = (branch_text, len(branch_text))
 
             # pr
             if result.pr_info is not None:
@@ -126,70 +183,110 @@ class ProgressiveDisplay:
                     pr_number = result.pr_info.get("number")
                     pr_url = result.pr_info.get("url")
                     if pr_number and pr_url:
-                        pr_status = self.create_hyperlink(pr_url, str(pr_number))
+                        pr_text = str(pr_number)
+                        pr_status = (
+                            self.create_hyperlink(pr_url, pr_text),
+                            len(pr_text),
+                        )
                     else:
-                        pr_status = "Yes"
+                        pr_status = ("Yes", 3)
                 else:
-                    pr_status = "No"
+                    pr_status = ("No", 2)
             elif result.errors and "pr" in result.errors:
-                pr_status = "Error"
+                pr_status = ("Error", 5)
             else:
-                pr_status = spinner_char
+                pr_status = (spinner_char, 1)
 
-            # remote
+            # remote (sync indicators are single-glyph colored strings)
             if result.sync_status is not None or result.is_remote_updated is not None:
-                remote_status = self._get_sync_indicator(result)
+                remote_status = (self._get_sync_indicator(result), 1)
             elif result.errors and "remote" in result.errors:
-                remote_status = "Error"
+                remote_status = ("Error", 5)
             else:
-                remote_status = spinner_char
+                remote_status = (spinner_char, 1)
 
             # repo name
             if result.repo_url:
-                repo_name = self.create_hyperlink(result.repo_url, result.display_name)
+                repo_name = (
+                    self.create_hyperlink(result.repo_url, result.display_name),
+                    len(result.display_name),
+                )
             else:
-                repo_name = result.display_name
+                repo_name = (result.display_name, len(result.display_name))
 
             rows.append((repo_name, unstaged, branch, pr_status, remote_status))
 
-        # ANSI-aware visible length helper
-        def visible_len(s: str) -> int:
-            return len(re.sub(r"\033\]8;;[^\033]*\033\\|\033\]8;;\033\\|\033\[[0-9;]*m", "", s))
+        repo_w = max(30, max(r[0][1] for r in rows) if rows else 30)
+        unstaged_w = max(10, max(r[1][1] for r in rows) if rows else 10)
+        branch_w = max(20, max(r[2][1] for r in rows) if rows else 20)
+        pr_w = max(8, max(r[3][1] for r in rows) if rows else 8)
+        sync_w = max(14, max(r[4][1] for r in rows) if rows else 14)
 
-        repo_w = max(30, max(visible_len(r[0]) for r in rows) if rows else 30)
-        unstaged_w = max(10, max(visible_len(r[1]) for r in rows) if rows else 10)
-        branch_w = max(20, max(visible_len(r[2]) for r in rows) if rows else 20)
-        pr_w = max(8, max(visible_len(r[3]) for r in rows) if rows else 8)
-        sync_w = max(14, max(visible_len(r[4]) for r in rows) if rows else 14)
+        # Widths only ever grow; when one does, every row needs repadding,
+        # so force a full redraw (header included)
+        widths = (repo_w, unstaged_w, branch_w, pr_w, sync_w)
+        if self._widths is not None:
+            widths = (
+                max(widths[0], self._widths[0]),
+                max(widths[1], self._widths[1]),
+                max(widths[2], self._widths[2]),
+                max(widths[3], self._widths[3]),
+                max(widths[4], self._widths[4]),
+            )
+        if widths != self._widths:
+            self._widths = widths
+            self.header_printed = False
+            self._last_lines.clear()
+        repo_w, unstaged_w, branch_w, pr_w, sync_w = widths
 
-        # Print header with computed widths
-        self.print_header(repo_w, unstaged_w, branch_w, pr_w, sync_w)
+        # Everything for this refresh — header, clears, row moves, content —
+        # accumulates here and goes out in one write, so the syscall count
+        # per refresh stays bounded regardless of repo count
+        buf: List[str] = []
+        self.print_header(buf, repo_w, unstaged_w, branch_w, pr_w, sync_w)
 
-        # Render each row
+        # Render only the rows whose content actually changed
         for i, (repo_name, unstaged, branch, pr_status, remote_status) in enumerate(rows):
             line_num = 3 + i
-            self.move_to_line(line_num)
-            self.clear_to_end_of_line()
 
-            repo_col = self.pad_with_ansi(repo_name, repo_w)
-            unstaged_col = self.pad_with_ansi(str(unstaged), unstaged_w)
-            branch_col = self.pad_with_ansi(str(branch), branch_w)
-            pr_col = self.pad_with_ansi(str(pr_status), pr_w)
-            remote_col = self.pad_with_ansi(remote_status, sync_w, "center")
+            # Only the hyperlink cells need ANSI-aware padding; unstaged
+            # and branch are plain text, and the sync cell's visible width
+            # is already known, so it centers with plain arithmetic
+            repo_col = self.pad_with_ansi(repo_name[0], repo_w, vlen=repo_name[1])
+            unstaged_col = unstaged[0].ljust(unstaged_w)
+            branch_col = branch[0].ljust(branch_w)
+            pr_col = self.pad_with_ansi(pr_status[0], pr_w, vlen=pr_status[1])
+            sync_pad = sync_w - remote_status[1]
+            if sync_pad > 0:
+                left = sync_pad // 2
+                remote_col = (
+                    " " * left + remote_status[0] + " " * (sync_pad - left)
+                )
+            else:
+                remote_col = remote_status[0]
 
             line_content = f"{repo_col} {unstaged_col} {branch_col} {pr_col} {remote_col}"
-            print(line_content, end="")
+            if self._last_lines.get(line_num) == line_content:
+                continue
+            self._last_lines[line_num] = line_content
+            buf.append(f"\033[{line_num};1H\033[K{line_content}")
+
+        if buf:
+            self._write("".join(buf))
 
         # Update spinner for next display refresh
         self.spinner_index += 1
-        sys.stdout.flush()
+        self._last_rendered_line = 2 + len(rows)
 
     def final_display(self, results: Dict[str, Any]) -> None:
         """Display final results without progress indicators"""
-        self.update_display(results)
+        # The processors force a "final" update_display before this runs,
+        # so the table is already current; only render if nothing was
+        # drawn yet (e.g. no display callback was wired up)
+        if self._last_rendered_line == 0:
+            self.update_display(results)
 
-        # Move cursor to the end
-        final_line = len(results) + 4
-        self.move_to_line(final_line)
+        # Move cursor to the end (one blank line below the table, as before)
+        self.move_to_line(self._last_rendered_line + 2)
 
-        print()  # Add final newline
+        self._write("\n")  # Add final newline
@@ -1,5 +1,9 @@
+import re
 from typing import List, Any, Tuple
 
+# Same OSC 8 / SGR stripper as the progressive display, compiled once
+_ANSI_RE = re.compile(r"\033\]8;;[^\033]*\033\\|\033\]8;;\033\\|\033\[[0-9;]*m")
+
 
 class Colors:
     GREEN = "\033[32m"
@@ -26,22 +30,20 @@ class Colors:
 
 
 class RepoDisplay:
+    # Sync status to colored indicator; looked up once per row
+    _SYNC_ICONS = {
+        "synced": Colors.green_icon(),
+        "ahead": Colors.yellow_icon("↑"),    # Local changes to push
+        "behind": Colors.red_icon("↓"),      # Remote changes to pull
+        "diverged": Colors.red_icon("↕"),    # Both ahead and behind
+    }
+    _UNKNOWN = Colors.gray_icon("?")
+
     def _get_sync_indicator(self, repo: Any) -> str:
         """Get sync status indicator based on repo sync status"""
         if hasattr(repo, 'sync_status'):
-            sync_status = repo.sync_status
-            status = sync_status.get("status", "unknown")
-            
-            if status == "synced":
-                return Colors.green_icon()
-            elif status == "ahead":
-                return Colors.yellow_icon("↑")  # Local changes to push
-            elif status == "behind":
-                return Colors.red_icon("↓")     # Remote changes to pull
-            elif status == "diverged":
-                return Colors.red_icon("↕")     # Both ahead and behind
-            else:
-                return Colors.gray_icon("?")    # Unknown status
+            status = repo.sync_status.get("status", "unknown")
+            return self._SYNC_ICONS.get(status, self._UNKNOWN)
         else:
             # Fallback to old behavior
             if repo.is_remote_updated:
@@ -51,7 +53,6 @@ class RepoDisplay:
 
     def show_repos(self, repos: List[Any]) -> None:
         """Display repository information in a formatted table with correct alignment for ANSI codes"""
-        import re
         if not repos:
             print("No git repositories found in current directory")
             return
@@ -63,7 +64,7 @@ class RepoDisplay:
         rows: List[Tuple[str, str, str, str, str]] = []
         for repo in repos:
             unstaged = str(repo.unstaged_changes)
-            branch = str(repo.current_branch)
+            branch = repo.current_branch
 
             pr_info = repo.pr_info
             if pr_info and pr_info.get("exists", False):
@@ -87,7 +88,7 @@ class RepoDisplay:
 
         # Calculate max visible length for each column
         def visible_len(s: str) -> int:
-            return len(re.sub(r"\033\]8;;[^\033]*\033\\|\033\]8;;\033\\|\033\[[0-9;]*m", "", s))
+            return len(_ANSI_RE.sub("", s))
 
         repo_w = max(30, max(visible_len(r[0]) for r in rows))
         unstaged_w = max(10, max(visible_len(r[1]) for r in rows))
@@ -120,6 +121,11 @@ class RepoDisplay:
         print(header)
         print("-" * len(header))
 
-        # Print rows
+        # Print rows; unstaged and branch are plain text and the sync
+        # indicator always has visible width 1, so only the hyperlink
+        # cells need the ANSI-aware pad
+        sync_left = (sync_w - 1) // 2
+        sync_right = sync_w - 1 - sync_left
         for repo_name, unstaged, branch, pr_status, remote_status in rows:
-            print(f"{pad(repo_name, repo_w)} {pad(unstaged, unstaged_w)} {pad(branch, branch_w)} {pad(pr_status, pr_w)} {pad(remote_status, sync_w, 'center')}")
+            sync_col = " " * sync_left + remote_status + " " * sync_right
+            print(f"{pad(repo_name, repo_w)} {unstaged.ljust(unstaged_w)} {branch.ljust(branch_w)} {pad(pr_status, pr_w)} {sync_col}")
@@ -1,3 +1,5 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 from git_utils import GitRepo
@@ -19,18 +21,48 @@ class RepoScanner:
         self.alias_parser.load_aliases(current_dir)
         repos: List[GitRepo] = []
 
-        for item in current_dir.iterdir():
-            if item.is_dir() and not item.name.startswith("."):
-                if self.exclude_parser.should_exclude(item.name, excludes):
+        # os.scandir caches the entry type from the directory read itself,
+        # so filtering to non-hidden directories costs no extra stat per
+        # entry (unlike Path.iterdir + is_dir)
+        candidates: List[str] = []
+        with os.scandir(current_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith(".") or not entry.is_dir(
+                    follow_symlinks=False
+                ):
                     continue
+                if self.exclude_parser.should_exclude(entry.name, excludes):
+                    continue
+                candidates.append(entry.path)
+
+        if not candidates:
+            return repos
+
+        # The .git existence probes, cache validation (stats each repo's
+        # .git directory), and cache saves are all I/O-bound syscall loops;
+        # run each across a pool instead of one directory at a time.
+        # executor.map preserves input order, so the repo list stays
+        # deterministic
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            is_repo = executor.map(
+                lambda p: os.path.lexists(os.path.join(p, ".git")), candidates
+            )
+            for item, has_git in zip(candidates, is_repo):
+                if has_git:
+                    repos.append(
+                        GitRepo(
+                            Path(item), self.alias_parser, use_real_names, self.cache
+                        )
+                    )
 
-                git_dir = item / ".git"
-                if git_dir.exists():
-                    repo = GitRepo(item, self.alias_parser, use_real_names, self.cache)
-                    repos.append(repo)
+            if repos:
+                list(
+                    executor.map(lambda r: r._load_cached_data(), repos)  # type: ignore[attr-defined]
+                )
 
-        # Save cache after processing all repos
-        for repo in repos:
-            repo._save_to_cache()  # type: ignore[attr-defined]
+                # Save cache after processing all repos
+                list(
+                    executor.map(lambda r: r._save_to_cache(), repos)  # type: ignore[attr-defined]
+                )
 
         return repos
@@ -1,14 +1,29 @@
-import shutil
+import functools
+import os
 from typing import List
 
+# $PATH split once at import; tool availability doesn't change mid-run
+_PATH_DIRS: List[str] = [
+    d for d in os.environ.get("PATH", "").split(os.pathsep) if d
+]
 
+
+def _tool_on_path(tool: str) -> bool:
+    """Probe each PATH entry with a single access() call per candidate"""
+    for directory in _PATH_DIRS:
+        if os.access(os.path.join(directory, tool), os.X_OK):
+            return True
+    return False
+
+
+@functools.lru_cache(maxsize=1)
 def check_requirements() -> bool:
     """Check if git and gh are installed"""
     required_tools: List[str] = ["git", "gh"]
     missing_tools: List[str] = []
 
     for tool in required_tools:
-        if not shutil.which(tool):
+        if not _tool_on_path(tool):
             missing_tools.append(tool)
 
     if missing_tools: